@@ -14,6 +14,7 @@ import sys
 import json
 import asyncio
 import logging
+import threading
 from typing import Optional, Any
 
 from mcp import ClientSession, StdioServerParameters
@@ -27,6 +28,42 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    input() runs in a daemon thread that hands its line (or EOFError) to
+    a future, so session traffic and other asyncio tasks keep running
+    while waiting for the user. Unlike asyncio.to_thread, a reader still
+    blocked in input() after Ctrl-C doesn't hold up asyncio.run's
+    shutdown until Enter is pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _settle(line: Optional[str], error: Optional[BaseException]):
+        # Already cancelled if Ctrl-C arrived while waiting
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+    
+    def _read():
+        try:
+            line, error = input(prompt), None
+        except BaseException as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(_settle, line, error)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    threading.Thread(target=_read, name="stdin-reader", daemon=True).start()
+    return await future
+
+
 class MCPWeixinClient:
     """
     MCP Client for WeChat Spider.
@@ -105,19 +142,20 @@ class MCPWeixinClient:
         
         return json.loads(result.content[0].text)
     
-    async def analyze_article(self, url: str) -> dict:
+    async def analyze_article(self, url: str, include_content: bool = False) -> dict:
         """
         Analyze a WeChat article.
         
         Args:
             url: WeChat article URL
+            include_content: Return full article content instead of the summary
             
         Returns:
             Dictionary with content and analysis
         """
         result = await self.session.call_tool(
             "analyze_weixin_article",
-            {"url": url}
+            {"url": url, "include_content": include_content}
         )
         
         return json.loads(result.content[0].text)
@@ -191,7 +229,7 @@ class MCPWeixinClient:
         
         while True:
             try:
-                user_input = input("\n> ").strip()
+                user_input = (await _ainput("\n> ")).strip()
                 
                 if not user_input:
                     continue
@@ -240,7 +278,7 @@ class MCPWeixinClient:
                     print("Enter URLs (one per line, empty line to finish):")
                     urls = []
                     while True:
-                        url = input("  ").strip()
+                        url = (await _ainput("  ")).strip()
                         if not url:
                             break
                         urls.append(url)
@@ -256,7 +294,7 @@ class MCPWeixinClient:
                     print("Enter 2-5 URLs to compare (empty line to finish):")
                     urls = []
                     while len(urls) < 5:
-                        url = input("  ").strip()
+                        url = (await _ainput("  ")).strip()
                         if not url:
                             break
                         urls.append(url)
@@ -272,7 +310,8 @@ class MCPWeixinClient:
                     print(f"Unknown command: {command}")
                     print("Type 'help' for available commands")
                     
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # Python 3.11+ asyncio.run delivers Ctrl-C as cancellation
                 print("\n\nInterrupted. Goodbye!")
                 break
             except Exception as e:
@@ -31,9 +31,15 @@ Configure in Cursor/Claude:
 import os
 import sys
 import re
-import json
+import time
+import asyncio
 import logging
-from typing import Optional
+import contextlib
+import functools
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Optional, Any
 
 # Add parent directory to PYTHONPATH for weixin_spider_simple import
 # This should be set in MCP config: "PYTHONPATH": "/path/to/mcp-weixin"
@@ -41,7 +47,8 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__f
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from mcp.server.fastmcp import FastMCP
+import orjson
+from mcp.server.fastmcp import FastMCP, Context
 
 # Configure logging
 logging.basicConfig(
@@ -57,27 +64,48 @@ app = FastMCP("mcp-weixin-spider")
 DOWNLOAD_IMAGES = os.getenv("DOWNLOAD_IMAGES", "true").lower() == "true"
 WAIT_TIME = int(os.getenv("WAIT_TIME", "10"))
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "./downloads")
+# Max crawls in flight per batch call (keeps us under WeChat rate limits)
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+# Crawl cache: how many articles to keep and for how long (seconds)
+CACHE_SIZE = int(os.getenv("CACHE_SIZE", "256"))
+CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))
+
+# Parsed articles keyed by (url, download_images, output_dir), LRU order
+_article_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+_article_cache_lock = threading.Lock()
 
 # Crawler backend: "selenium" (default) or "agentbrowser"
 CRAWLER_BACKEND = os.getenv("CRAWLER_BACKEND", "selenium").lower()
 
 
+# Hosts the spiders accept; checked before any browser work is done
+_WEIXIN_URL = re.compile(r'^https?://(?:mp\.)?weixin\.qq\.com/')
+
+# sanitize_path() tables, built once at import
+_PATH_SEPARATORS = str.maketrans("./\\", "___")
+_UNSAFE_PATH_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_path(name: str) -> str:
     """
     Sanitize path component to prevent directory traversal attacks.
     Removes path separators and dangerous characters.
     """
-    # Remove path separators and parent directory references
-    sanitized = re.sub(r'[./\\]', '_', name)
-    # Remove any remaining dangerous characters
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '', sanitized)
+    # Replace path separators and parent directory references, then
+    # remove any remaining dangerous characters
+    sanitized = _UNSAFE_PATH_CHARS.sub('', name.translate(_PATH_SEPARATORS))
     # Limit length
     return sanitized[:100] if sanitized else "unnamed"
 
 
-def get_spider():
+# Spider singleton, created by _warm_spider() at startup
+_SPIDER = None
+
+
+def _load_spider():
     """
-    Lazy import and get spider instance.
+    Import the configured backend and get its spider instance.
     
     Uses CRAWLER_BACKEND env var to select:
     - "selenium": Full Selenium/Chrome crawler (more features, heavier)
@@ -93,6 +121,134 @@ def get_spider():
         return WeixinSpider.get_instance()
 
 
+def _warm_spider():
+    """
+    Import the backend and create the spider before serving requests.
+    
+    Moves the import and browser start-up out of the first tool call. On
+    failure the server still starts and get_spider() retries lazily.
+    """
+    global _SPIDER
+    try:
+        _SPIDER = _load_spider()
+    except Exception as e:
+        logger.warning(f"Spider warm-up failed, will retry on first use: {e}")
+
+
+def get_spider():
+    """Get the spider instance, creating it on first use if not warmed."""
+    global _SPIDER
+    if _SPIDER is None:
+        _SPIDER = _load_spider()
+    return _SPIDER
+
+
+def _check_weixin_url(url: str) -> None:
+    """Reject non-WeChat URLs instantly instead of after a page load."""
+    if not _WEIXIN_URL.match(url):
+        raise ValueError(f"Not a WeChat article URL: {url}")
+
+
+def _unique_urls(urls: list[str]) -> list[str]:
+    """Strip and de-duplicate URLs, keeping first-seen order."""
+    return list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize a tool result to compact JSON text.
+    
+    orjson writes UTF-8 directly (CJK is never escaped) and is much faster
+    than the stdlib encoder on long article bodies. Responses are not
+    indented: they are read by the MCP client, which can pretty-print.
+    """
+    return orjson.dumps(obj).decode("utf-8")
+
+
+def _cache_get(key: tuple) -> Optional[Any]:
+    """Return a cached article, or None if missing or older than CACHE_TTL."""
+    with _article_cache_lock:
+        entry = _article_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, article = entry
+        if time.monotonic() - stored_at > CACHE_TTL:
+            del _article_cache[key]
+            return None
+        _article_cache.move_to_end(key)
+        return article
+
+
+def _cache_put(key: tuple, article: Any) -> None:
+    """Store an article, evicting the least recently used beyond CACHE_SIZE."""
+    if CACHE_SIZE <= 0:
+        return
+    with _article_cache_lock:
+        _article_cache[key] = (time.monotonic(), article)
+        _article_cache.move_to_end(key)
+        while len(_article_cache) > CACHE_SIZE:
+            _article_cache.popitem(last=False)
+
+
+def _tool_errors(fn):
+    """
+    Turn exceptions raised by an async tool into a JSON error response.
+    
+    Keeps the tool bodies to the happy path; invalid input (ValueError)
+    is reported without logging it as a server error.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except ValueError as e:
+            return _dumps({"error": str(e), "type": "ValueError"})
+        except Exception as e:
+            logger.error(f"Error in {fn.__name__}: {e}")
+            return _dumps({"error": str(e), "type": type(e).__name__})
+    return wrapper
+
+
+@contextlib.asynccontextmanager
+async def _spider_session(spider):
+    """
+    Use the spider's context manager without blocking the event loop.
+    
+    Entering may wait for a crawl running in another tool call, load
+    cookies or start the browser, so both halves run in a worker thread.
+    """
+    await asyncio.to_thread(spider.__enter__)
+    try:
+        yield spider
+    finally:
+        await asyncio.to_thread(spider.__exit__, *sys.exc_info())
+
+
+async def _cached_crawl(
+    spider,
+    url: str,
+    download_images: bool = False,
+    output_dir: Optional[str] = None
+):
+    """
+    Crawl through the article cache.
+    
+    Repeated tool calls on the same URL (e.g. summarize then analyze)
+    reuse the parsed article instead of loading the page again.
+    """
+    key = (url, download_images, output_dir)
+    article = _cache_get(key)
+    if article is None:
+        article = await spider.acrawl(
+            url=url,
+            download_images=download_images,
+            output_dir=output_dir,
+            wait_time=WAIT_TIME
+        )
+        _cache_put(key, article)
+    return article
+
+
 @app.tool()
 def load_browser_cookies(cookies_json: str) -> str:
     """
@@ -120,10 +276,10 @@ def load_browser_cookies(cookies_json: str) -> str:
     
     try:
         # Validate JSON
-        cookies = json.loads(cookies_json)
+        cookies = orjson.loads(cookies_json)
         
         if not isinstance(cookies, list):
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "cookies_json must be a JSON array of cookie objects"
             })
@@ -140,36 +296,37 @@ def load_browser_cookies(cookies_json: str) -> str:
             "origins": []
         }
         
-        with open(state_file, 'w') as f:
-            json.dump(storage_state, f)
+        with open(state_file, 'wb') as f:
+            f.write(orjson.dumps(storage_state))
         
         # Set env var for spider to use
         os.environ["BROWSER_STATE_FILE"] = state_file
         
         logger.info(f"Loaded {len(cookies)} cookies to {state_file}")
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "state_file": state_file,
             "cookie_count": len(cookies),
             "message": "Cookies loaded. Now call crawl_weixin_article."
-        }, ensure_ascii=False)
+        })
         
-    except json.JSONDecodeError as e:
-        return json.dumps({
+    except orjson.JSONDecodeError as e:
+        return _dumps({
             "success": False,
             "error": f"Invalid JSON: {e}"
         })
     except Exception as e:
         logger.error(f"Error loading cookies: {e}")
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": str(e)
         })
 
 
 @app.tool()
-def crawl_weixin_article(
+@_tool_errors
+async def crawl_weixin_article(
     url: str, 
     download_images: bool = True, 
     custom_filename: Optional[str] = None
@@ -199,38 +356,31 @@ def crawl_weixin_article(
     Example:
         crawl_weixin_article("https://mp.weixin.qq.com/s/...")
     """
-    try:
-        spider = get_spider()
-        
-        # Determine output directory (sanitize to prevent path traversal)
-        output_dir = None
-        if download_images and custom_filename:
-            safe_filename = sanitize_path(custom_filename)
-            output_dir = os.path.join(OUTPUT_DIR, safe_filename)
-        
-        article = spider.crawl(
-            url=url,
-            download_images=download_images and DOWNLOAD_IMAGES,
-            output_dir=output_dir,
-            wait_time=WAIT_TIME
-        )
-        
-        result = article.to_dict()
-        logger.info(f"Successfully crawled: {result.get('title', 'Unknown')}")
-        
-        return json.dumps(result, ensure_ascii=False, indent=2)
-        
-    except ValueError as e:
-        error_msg = {"error": str(e), "type": "ValueError"}
-        return json.dumps(error_msg, ensure_ascii=False)
-    except Exception as e:
-        logger.error(f"Error crawling article: {e}")
-        error_msg = {"error": str(e), "type": type(e).__name__}
-        return json.dumps(error_msg, ensure_ascii=False)
+    _check_weixin_url(url)
+    spider = get_spider()
+    
+    # Determine output directory (sanitize to prevent path traversal)
+    output_dir = None
+    if download_images and custom_filename:
+        safe_filename = sanitize_path(custom_filename)
+        output_dir = os.path.join(OUTPUT_DIR, safe_filename)
+    
+    article = await _cached_crawl(
+        spider,
+        url,
+        download_images=download_images and DOWNLOAD_IMAGES,
+        output_dir=output_dir
+    )
+    
+    result = article.to_dict()
+    logger.info(f"Successfully crawled: {result.get('title', 'Unknown')}")
+    
+    return _dumps(result)
 
 
 @app.tool()
-def analyze_weixin_article(url: str) -> str:
+@_tool_errors
+async def analyze_weixin_article(url: str, include_content: bool = False) -> str:
     """
     爬取并分析微信公众号文章，返回统计数据。
     
@@ -239,10 +389,14 @@ def analyze_weixin_article(url: str) -> str:
     
     Args:
         url: 微信公众号文章链接 (WeChat article URL)
+        include_content: 是否返回完整正文 (Return the full article, including
+                         content_html/content_text, instead of the summary;
+                         default False keeps the response small)
         
     Returns:
         JSON string with:
-        - content: 文章内容 (article content)
+        - content: 文章摘要，或 include_content=True 时的完整内容
+                   (article summary, or full article content)
         - analysis: 分析结果 (analysis results)
             - word_count: 字数
             - char_count: 字符数
@@ -254,34 +408,27 @@ def analyze_weixin_article(url: str) -> str:
     Example:
         analyze_weixin_article("https://mp.weixin.qq.com/s/...")
     """
-    try:
-        spider = get_spider()
-        
-        # Crawl without downloading images for faster analysis
-        article = spider.crawl(
-            url=url,
-            download_images=False,
-            wait_time=WAIT_TIME
-        )
-        
-        analysis = spider.analyze_article(article)
-        
-        result = {
-            "content": article.to_dict(),
-            "analysis": analysis
-        }
-        
-        logger.info(f"Analyzed article: {article.title}")
-        return json.dumps(result, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        logger.error(f"Error analyzing article: {e}")
-        error_msg = {"error": str(e), "type": type(e).__name__}
-        return json.dumps(error_msg, ensure_ascii=False)
+    _check_weixin_url(url)
+    spider = get_spider()
+    
+    # Crawl without downloading images for faster analysis
+    article = await _cached_crawl(spider, url, download_images=False)
+    
+    analysis = spider.analyze_article(article)
+    
+    content = article.to_dict() if include_content else spider.summarize_article(article)
+    result = {
+        "content": content,
+        "analysis": analysis
+    }
+    
+    logger.info(f"Analyzed article: {article.title}")
+    return _dumps(result)
 
 
 @app.tool()
-def summarize_weixin_article(url: str) -> str:
+@_tool_errors
+async def summarize_weixin_article(url: str) -> str:
     """
     获取微信公众号文章的简要摘要。
     
@@ -305,33 +452,31 @@ def summarize_weixin_article(url: str) -> str:
     Example:
         summarize_weixin_article("https://mp.weixin.qq.com/s/...")
     """
-    try:
-        spider = get_spider()
-        
-        article = spider.crawl(
-            url=url,
-            download_images=False,
-            wait_time=WAIT_TIME
-        )
-        
-        summary = spider.summarize_article(article)
-        
-        logger.info(f"Summarized article: {article.title}")
-        return json.dumps(summary, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        logger.error(f"Error summarizing article: {e}")
-        error_msg = {"error": str(e), "type": type(e).__name__}
-        return json.dumps(error_msg, ensure_ascii=False)
+    _check_weixin_url(url)
+    spider = get_spider()
+    
+    article = await _cached_crawl(spider, url, download_images=False)
+    
+    summary = spider.summarize_article(article)
+    
+    logger.info(f"Summarized article: {article.title}")
+    return _dumps(summary)
 
 
 @app.tool()
-def batch_crawl_articles(urls: list[str], download_images: bool = False) -> str:
+@_tool_errors
+async def batch_crawl_articles(
+    urls: list[str],
+    download_images: bool = False,
+    ctx: Context = None
+) -> str:
     """
     批量爬取多篇微信公众号文章。
     
-    Batch crawl multiple WeChat articles. Returns summaries for each article
-    to keep response size manageable.
+    Batch crawl multiple WeChat articles concurrently. Returns summaries for
+    each article to keep response size manageable. Duplicate URLs are
+    crawled once; unique_count reports how many distinct URLs were used.
+    Progress notifications are sent as each article finishes.
     
     Args:
         urls: 微信文章链接列表 (List of WeChat article URLs)
@@ -346,47 +491,63 @@ def batch_crawl_articles(urls: list[str], download_images: bool = False) -> str:
             "https://mp.weixin.qq.com/s/article2"
         ])
     """
-    try:
+    requested = len(urls)
+    urls = _unique_urls(urls)
+    
+    # Reject non-WeChat URLs up front; only the rest reach the browser
+    valid_urls = [u for u in urls if _WEIXIN_URL.match(u)]
+    results = []
+    errors = [
+        {"url": u, "error": f"Not a WeChat article URL: {u}"}
+        for u in urls if not _WEIXIN_URL.match(u)
+    ]
+    
+    if valid_urls:
         spider = get_spider()
-        results = []
-        errors = []
-        
-        for i, url in enumerate(urls):
-            try:
-                logger.info(f"Crawling article {i+1}/{len(urls)}: {url[:50]}...")
-                article = spider.crawl(
-                    url=url,
-                    download_images=download_images,
-                    wait_time=WAIT_TIME
-                )
-                summary = spider.summarize_article(article)
-                results.append(summary)
-                
-            except Exception as e:
-                errors.append({
-                    "url": url,
-                    "error": str(e)
-                })
-                logger.warning(f"Failed to crawl {url}: {e}")
-        
-        output = {
-            "total": len(urls),
-            "success": len(results),
-            "failed": len(errors),
-            "articles": results,
-            "errors": errors if errors else None
-        }
-        
-        return json.dumps(output, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        logger.error(f"Error in batch crawl: {e}")
-        error_msg = {"error": str(e), "type": type(e).__name__}
-        return json.dumps(error_msg, ensure_ascii=False)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def _crawl_one(i: int, url: str) -> tuple[int, dict]:
+            async with semaphore:
+                try:
+                    logger.info(f"Crawling article {i+1}/{len(valid_urls)}: {url[:50]}...")
+                    article = await _cached_crawl(
+                        spider, url, download_images=download_images
+                    )
+                    return i, {"summary": spider.summarize_article(article)}
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to crawl {url}: {e}")
+                    return i, {"error": {"url": url, "error": str(e)}}
+        
+        # One browser session serves the whole batch. Crawls are collected
+        # as they finish so progress can be reported, then put back in
+        # input order (TaskGroup would need 3.11+).
+        outcomes: list[dict] = [{}] * len(valid_urls)
+        async with _spider_session(spider):
+            pending = [_crawl_one(i, url) for i, url in enumerate(valid_urls)]
+            for done, next_done in enumerate(asyncio.as_completed(pending), 1):
+                i, outcome = await next_done
+                outcomes[i] = outcome
+                if ctx is not None:
+                    await ctx.report_progress(done, len(valid_urls))
+        results = [o["summary"] for o in outcomes if "summary" in o]
+        errors.extend(o["error"] for o in outcomes if "error" in o)
+    
+    output = {
+        "total": requested,
+        "unique_count": len(urls),
+        "success": len(results),
+        "failed": len(errors),
+        "articles": results,
+        "errors": errors if errors else None
+    }
+    
+    return _dumps(output)
 
 
 @app.tool()
-def compare_articles(urls: list[str]) -> str:
+@_tool_errors
+async def compare_articles(urls: list[str]) -> str:
     """
     对比分析多篇微信公众号文章。
     
@@ -394,7 +555,7 @@ def compare_articles(urls: list[str]) -> str:
     Useful for competitive analysis of public accounts.
     
     Args:
-        urls: 微信文章链接列表 (List of 2-5 WeChat article URLs to compare)
+        urls: 微信文章链接列表 (List of 2-5 distinct WeChat article URLs to compare)
         
     Returns:
         JSON string with comparison data:
@@ -407,70 +568,83 @@ def compare_articles(urls: list[str]) -> str:
             "https://mp.weixin.qq.com/s/competitor2_article"
         ])
     """
-    try:
-        if len(urls) < 2:
-            return json.dumps({"error": "Need at least 2 URLs to compare"})
-        if len(urls) > 5:
-            return json.dumps({"error": "Maximum 5 URLs for comparison"})
-        
+    requested = len(urls)
+    urls = _unique_urls(urls)
+    
+    if len(urls) < 2:
+        return _dumps({"error": "Need at least 2 URLs to compare"})
+    if len(urls) > 5:
+        return _dumps({"error": "Maximum 5 URLs for comparison"})
+    
+    # Reject non-WeChat URLs up front; only the rest reach the browser
+    valid_urls = [u for u in urls if _WEIXIN_URL.match(u)]
+    analyzed = {}
+    
+    if valid_urls:
         spider = get_spider()
-        articles_data = []
         
-        for url in urls:
+        async def _crawl_and_analyze(url: str) -> dict:
             try:
-                article = spider.crawl(url, download_images=False, wait_time=WAIT_TIME)
-                analysis = spider.analyze_article(article)
-                summary = spider.summarize_article(article)
-                
-                articles_data.append({
-                    "summary": summary,
-                    "analysis": analysis
-                })
+                article = await _cached_crawl(spider, url, download_images=False)
+                return {
+                    "summary": spider.summarize_article(article),
+                    "analysis": spider.analyze_article(article)
+                }
             except Exception as e:
-                articles_data.append({
+                return {
                     "url": url,
                     "error": str(e)
-                })
-        
-        # Build comparison table
-        comparison = {
-            "by_word_count": sorted(
-                [a for a in articles_data if "summary" in a],
-                key=lambda x: x["analysis"]["word_count"],
-                reverse=True
-            ),
-            "by_image_count": sorted(
-                [a for a in articles_data if "summary" in a],
-                key=lambda x: x["analysis"]["image_count"],
-                reverse=True
-            ),
-            "stats": {
-                "total_articles": len(urls),
-                "successfully_analyzed": len([a for a in articles_data if "summary" in a]),
-                "avg_word_count": sum(
-                    a["analysis"]["word_count"] 
-                    for a in articles_data if "analysis" in a
-                ) / max(len([a for a in articles_data if "analysis" in a]), 1),
-            }
-        }
+                }
         
-        result = {
-            "articles": articles_data,
-            "comparison": comparison
+        async with _spider_session(spider):
+            outcomes = await asyncio.gather(
+                *(_crawl_and_analyze(url) for url in valid_urls)
+            )
+        # URLs are unique by now, so they can key the outcomes
+        analyzed = dict(zip(valid_urls, outcomes))
+    
+    # Entries follow the input order, rejected URLs in their own place
+    articles_data = [
+        analyzed[u] if u in analyzed
+        else {"url": u, "error": f"Not a WeChat article URL: {u}"}
+        for u in urls
+    ]
+    
+    # Build comparison table from the successfully analyzed subset, with
+    # (word_count, image_count, article) keys read out of each dict once
+    keyed = [
+        (a["analysis"]["word_count"], a["analysis"]["image_count"], a)
+        for a in articles_data if "summary" in a
+    ]
+    word_count_total = sum(k[0] for k in keyed)
+    comparison = {
+        "by_word_count": [
+            k[2] for k in sorted(keyed, key=itemgetter(0), reverse=True)
+        ],
+        "by_image_count": [
+            k[2] for k in sorted(keyed, key=itemgetter(1), reverse=True)
+        ],
+        "stats": {
+            "total_articles": requested,
+            "unique_count": len(urls),
+            "successfully_analyzed": len(keyed),
+            "avg_word_count": word_count_total / max(len(keyed), 1),
         }
-        
-        return json.dumps(result, ensure_ascii=False, indent=2)
-        
-    except Exception as e:
-        logger.error(f"Error comparing articles: {e}")
-        error_msg = {"error": str(e), "type": type(e).__name__}
-        return json.dumps(error_msg, ensure_ascii=False)
+    }
+    
+    result = {
+        "articles": articles_data,
+        "comparison": comparison
+    }
+    
+    return _dumps(result)
 
 
 def main():
     """Run the MCP server."""
     logger.info("Starting MCP WeChat Spider Server...")
     logger.info(f"Config: CRAWLER_BACKEND={CRAWLER_BACKEND}, DOWNLOAD_IMAGES={DOWNLOAD_IMAGES}, WAIT_TIME={WAIT_TIME}s")
+    _warm_spider()
     app.run()
 
 
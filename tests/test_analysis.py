@@ -0,0 +1,130 @@
+"""Tests for analyze_article() and URL checks in both spider backends."""
+
+import importlib
+
+import pytest
+
+
+SAMPLE_HTML = """
+<section>
+  <p>First paragraph with <strong>Key point</strong>.</p>
+  <p class="rich_media">Second <strong>Bold <em>phrase</em></strong> here.</p>
+  <p><strong>  Padded  </strong><strong></strong></p>
+  <p><strong>""" + "x" * 150 + """</strong></p>
+</section>
+"""
+
+# WeChat's editor wraps runs of text in <span>; the words must not split
+CJK_HTML = """
+<p><strong>重要<em>提示</em>内容</strong></p>
+<p><strong><span>关键</span><span>信息</span></strong>，正文</p>
+<p><span><strong><span style="color: red">公众号</span>名称</strong></span></p>
+"""
+
+
+def _backend(module_name, class_name, backend_id):
+    """pytest param of (module, spider class), skipped if it can't import."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        return pytest.param((None, None), id=backend_id, marks=pytest.mark.skip(reason=str(e)))
+    return pytest.param((module, getattr(module, class_name)), id=backend_id)
+
+
+@pytest.fixture(params=[
+    _backend("weixin_spider_agentbrowser", "WeixinSpiderAB", "agentbrowser"),
+    _backend("weixin_spider_simple", "WeixinSpider", "selenium"),
+])
+def backend(request):
+    return request.param
+
+
+def _analyze(module, spider_cls, html):
+    # analyze_article only needs the class constants, not a browser
+    spider = spider_cls.__new__(spider_cls)
+    article = module.ArticleContent(url="https://mp.weixin.qq.com/s/x", content_html=html)
+    article.content_text = "正文" * 300
+    article.word_count = len(article.content_text)
+    return spider.analyze_article(article)
+
+
+def test_regex_analysis(backend, monkeypatch):
+    module, spider_cls = backend
+    monkeypatch.setattr(module, "HTMLParser", None)
+
+    analysis = _analyze(module, spider_cls, SAMPLE_HTML)
+
+    assert analysis["paragraph_count"] == 4
+    assert analysis["key_phrases"] == ["Key point", "Bold phrase", "Padded"]
+    assert analysis["estimated_read_time_minutes"] == 3.0
+
+
+@pytest.mark.parametrize("html", [SAMPLE_HTML, CJK_HTML], ids=["latin", "cjk"])
+def test_selectolax_matches_regex(backend, monkeypatch, html):
+    module, spider_cls = backend
+    if module.HTMLParser is None:
+        pytest.skip("selectolax not installed")
+
+    parsed = _analyze(module, spider_cls, html)
+    monkeypatch.setattr(module, "HTMLParser", None)
+    regex = _analyze(module, spider_cls, html)
+
+    assert parsed == regex
+
+
+def test_cjk_phrases_stay_whole(backend):
+    module, spider_cls = backend
+
+    analysis = _analyze(module, spider_cls, CJK_HTML)
+
+    assert analysis["key_phrases"] == ["重要提示内容", "关键信息", "公众号名称"]
+
+
+def test_selectolax_skips_nested_strong(backend):
+    module, spider_cls = backend
+    if module.HTMLParser is None:
+        pytest.skip("selectolax not installed")
+
+    html = "<p><strong>outer <strong>inner</strong> end</strong></p><p><strong>a<br>b</strong></p>"
+    analysis = _analyze(module, spider_cls, html)
+
+    assert analysis["key_phrases"] == ["outer inner end", "a b"]
+
+
+def test_empty_html_only_estimates_read_time(backend):
+    module, spider_cls = backend
+
+    analysis = _analyze(module, spider_cls, "")
+
+    assert analysis["paragraph_count"] == 0
+    assert analysis["key_phrases"] == []
+    assert analysis["estimated_read_time_minutes"] == 3.0
+
+
+@pytest.mark.parametrize(
+    "url, valid",
+    [
+        ("https://mp.weixin.qq.com/s/abc", True),
+        ("http://weixin.qq.com/s/abc", True),
+        ("https://example.com/s/abc", False),
+        ("https://mp.weixin.qq.com.evil.com/s/abc", False),
+    ],
+)
+def test_is_valid_weixin_url(backend, url, valid):
+    module, spider_cls = backend
+    spider = spider_cls.__new__(spider_cls)
+
+    assert spider._is_valid_weixin_url(url) is valid
+
+
+def test_selenium_url_check_reuses_cached_parse():
+    simple = pytest.importorskip("weixin_spider_simple")
+    simple._parse_host.cache_clear()
+    spider = simple.WeixinSpider.__new__(simple.WeixinSpider)
+    url = "https://mp.weixin.qq.com/s/abc"
+
+    assert spider._is_valid_weixin_url(url)
+    assert spider._is_valid_weixin_url(url)
+    assert simple._parse_host.cache_info().hits == 1
+    # The host set is matched against the whole netloc
+    assert not spider._is_valid_weixin_url("https://mp.weixin.qq.com@evil.com/s/abc")
@@ -0,0 +1,201 @@
+"""Tests for the MCP server helpers and batch tools, using a fake spider."""
+
+import asyncio
+import json
+
+import pytest
+
+from mcp_weixin_spider import server
+
+
+WEIXIN = "https://mp.weixin.qq.com/s/"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    server._article_cache.clear()
+    yield
+    server._article_cache.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeArticle:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeSpider:
+    """Crawls finish in reverse order; URLs containing "fail" raise."""
+
+    def __init__(self):
+        self.crawled = []
+        self.entered = 0
+
+    def __enter__(self):
+        self.entered += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def acrawl(self, url, **kwargs):
+        self.crawled.append(url)
+        await asyncio.sleep(0.05 / len(self.crawled))
+        if "fail" in url:
+            raise RuntimeError(f"boom: {url}")
+        return FakeArticle(url)
+
+    def summarize_article(self, article):
+        return {"url": article.url}
+
+    def analyze_article(self, article):
+        return {"word_count": len(article.url), "image_count": 0}
+
+
+@pytest.fixture
+def spider(monkeypatch):
+    fake = FakeSpider()
+    monkeypatch.setattr(server, "_SPIDER", fake)
+    return fake
+
+
+def test_dumps_matches_stdlib_json():
+    obj = {"title": "标题", "count": 3, "ratio": 0.5, "tags": ["a", None, True]}
+
+    assert json.loads(server._dumps(obj)) == obj
+
+
+def test_dumps_writes_cjk_unescaped_and_compact():
+    text = server._dumps({"title": "微信文章", "images": [1, 2]})
+
+    assert text == '{"title":"微信文章","images":[1,2]}'
+    assert isinstance(text, str)
+
+
+def test_dumps_rejects_unserializable_values():
+    with pytest.raises(TypeError):
+        server._dumps({"article": object()})
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(server.time, "monotonic", clock)
+    monkeypatch.setattr(server, "CACHE_TTL", 60)
+
+    server._cache_put(("a",), "article")
+    clock.now += 60
+    assert server._cache_get(("a",)) == "article"
+    clock.now += 1
+    assert server._cache_get(("a",)) is None
+    assert ("a",) not in server._article_cache
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(server, "CACHE_SIZE", 2)
+
+    server._cache_put(("a",), "A")
+    server._cache_put(("b",), "B")
+    assert server._cache_get(("a",)) == "A"
+    server._cache_put(("c",), "C")
+
+    assert server._cache_get(("b",)) is None
+    assert server._cache_get(("a",)) == "A"
+    assert server._cache_get(("c",)) == "C"
+
+
+def test_cache_disabled_with_zero_size(monkeypatch):
+    monkeypatch.setattr(server, "CACHE_SIZE", 0)
+
+    server._cache_put(("a",), "A")
+    assert server._cache_get(("a",)) is None
+
+
+async def test_cached_crawl_reuses_article(spider):
+    first = await server._cached_crawl(spider, WEIXIN + "1")
+    second = await server._cached_crawl(spider, WEIXIN + "1")
+
+    assert first is second
+    assert spider.crawled == [WEIXIN + "1"]
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("../../etc/passwd", "______etc_passwd"),
+        ("公众号", "unnamed"),
+        ("", "unnamed"),
+        ("a b/c.d", "ab_c_d"),
+        ("x" * 150, "x" * 100),
+    ],
+)
+def test_sanitize_path(name, expected):
+    assert server.sanitize_path(name) == expected
+
+
+def test_unique_urls_strips_and_keeps_first_seen_order():
+    urls = [" b ", "a", "", "   ", "b", "a\n", "c"]
+    assert server._unique_urls(urls) == ["b", "a", "c"]
+
+
+async def test_compare_articles_needs_two_unique_urls(spider):
+    result = json.loads(await server.compare_articles([WEIXIN + "1", WEIXIN + "1 "]))
+
+    assert result == {"error": "Need at least 2 URLs to compare"}
+    assert spider.crawled == []
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["https://mp.weixin.qq.com/s/abc", "http://weixin.qq.com/s/abc"],
+)
+def test_check_weixin_url_accepts_weixin(url):
+    server._check_weixin_url(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/s/abc",
+        "https://mp.weixin.qq.com.evil.com/s/abc",
+        "ftp://mp.weixin.qq.com/s/abc",
+        "mp.weixin.qq.com/s/abc",
+    ],
+)
+def test_check_weixin_url_rejects_others(url):
+    with pytest.raises(ValueError):
+        server._check_weixin_url(url)
+
+
+async def test_batch_crawl_keeps_input_order(spider):
+    urls = [WEIXIN + "1", "https://example.com/x", WEIXIN + "fail", WEIXIN + "2", WEIXIN + "1"]
+
+    result = json.loads(await server.batch_crawl_articles(urls))
+
+    assert spider.entered == 1
+    assert result["total"] == 5
+    assert result["unique_count"] == 4
+    assert [a["url"] for a in result["articles"]] == [WEIXIN + "1", WEIXIN + "2"]
+    assert [e["url"] for e in result["errors"]] == ["https://example.com/x", WEIXIN + "fail"]
+    assert "https://example.com/x" not in spider.crawled
+
+
+async def test_compare_articles_keeps_input_order(spider):
+    urls = ["https://example.com/x", WEIXIN + "long-article", WEIXIN + "fail", WEIXIN + "2"]
+
+    result = json.loads(await server.compare_articles(urls))
+
+    entries = result["articles"]
+    assert [e.get("url") or e["summary"]["url"] for e in entries] == urls
+    assert "error" in entries[0] and "error" in entries[2]
+    assert [a["summary"]["url"] for a in result["comparison"]["by_word_count"]] == [
+        WEIXIN + "long-article",
+        WEIXIN + "2",
+    ]
+    assert result["comparison"]["stats"]["successfully_analyzed"] == 2
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+HTML helpers shared by the spider backends.
+
+selectolax is optional (the 'html' extra). Without it HTMLParser is None
+and the backends' analyze_article falls back to regex.
+"""
+
+from typing import Iterator, List
+
+try:
+    # Optional C-backed HTML parser.
+    # selectolax 1.0 dropped the old Modest-based selectolax.parser
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+# Elements that start a new run of text, so the words either side of them
+# are kept apart
+_BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "blockquote", "pre",
+    "ul", "ol", "li", "table", "tr", "td", "th",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+})
+
+
+def _append_break(parts: List[str]) -> None:
+    """Add one space unless the text collected so far already ends in one."""
+    if parts and not parts[-1][-1:].isspace():
+        parts.append(" ")
+
+
+def _collect_text(node, parts: List[str]) -> None:
+    """
+    Gather the text under a node.
+
+    Inline elements are joined with no separator, the same as the regex
+    fallback's tag stripping. WeChat's editor wraps most runs of text in
+    <span>, and a Chinese phrase split across spans must stay one word.
+    """
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == "-text":
+            parts.append(child.text(deep=False))
+        elif tag == "br":
+            _append_break(parts)
+        elif tag in _BLOCK_TAGS:
+            _append_break(parts)
+            _collect_text(child, parts)
+            _append_break(parts)
+        else:
+            _collect_text(child, parts)
+
+
+def outer_strong_texts(tree) -> Iterator[str]:
+    """
+    Text of each <strong> in a selectolax tree that isn't nested inside
+    another <strong>, stripped of surrounding whitespace.
+    """
+    for node in tree.css("strong"):
+        parent = node.parent
+        while parent is not None and parent.tag != "strong":
+            parent = parent.parent
+        if parent is None:
+            parts: List[str] = []
+            _collect_text(node, parts)
+            yield "".join(parts).strip()
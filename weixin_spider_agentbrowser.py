@@ -14,16 +14,28 @@ Requires: agent-browser installed at /home/ubuntu/agent-browser/
 
 import os
 import re
+import queue
 import json
-import hashlib
+import atexit
+import asyncio
+import time
 import logging
+import selectors
+import tempfile
 import subprocess
 import threading
-from pathlib import Path
-from typing import Optional, Dict, Any, List
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
+
+# Optional selectolax parser (None without it); analyze_article falls
+# back to regex
+from weixin_html import HTMLParser, outer_strong_texts
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,11 +46,136 @@ AGENT_BROWSER_BIN = os.getenv(
     "/home/ubuntu/agent-browser/bin/agent-browser"
 )
 
-# Optional: Path to saved browser state (cookies, storage) to bypass anti-bot
-BROWSER_STATE_FILE = os.getenv("BROWSER_STATE_FILE", "")
+# Seconds to wait for network idle once #js_content is present, and the
+# extra time the CLI gets to report that wait timing out before it's killed
+NETWORK_IDLE_TIMEOUT = 5
+NETWORK_IDLE_GRACE = 3
+
+# Accepted article URL prefixes (mp.weixin.qq.com and weixin.qq.com)
+_WEIXIN_PREFIXES = (
+    "https://mp.weixin.qq.com/",
+    "http://mp.weixin.qq.com/",
+    "https://weixin.qq.com/",
+    "http://weixin.qq.com/",
+)
+
+# JS function mapping the first 20 images under a root element to
+# [{index, url, alt}]; WeChat lazy-loads images through data-src, and inline
+# data: placeholders are dropped in the page
+_IMAGE_URLS_FN = """((root) => root ? Array.from(root.querySelectorAll("img"))
+    .slice(0, 20)
+    .map((img, i) => ({index: i, url: img.dataset.src || img.src || "", alt: img.alt || ""}))
+    .filter((img) => img.url && !img.url.startsWith("data:")) : [])"""
+
+# Collects every field crawl() needs in one page evaluation. The body text
+# is only returned when #js_content is missing (the anti-bot page), so a
+# normal article is not transferred twice.
+_EXTRACT_PAGE_JS = """(() => {
+  // Each selector is resolved at most once per evaluation
+  const elements = {};
+  const query = (sel) => {
+    if (!(sel in elements)) elements[sel] = document.querySelector(sel);
+    return elements[sel];
+  };
+  const text = (sel) => {
+    const el = query(sel);
+    return el ? el.innerText.trim() : "";
+  };
+  const content = query("#js_content");
+  return JSON.stringify({
+    body: content ? "" : (document.body ? document.body.innerText : ""),
+    title: text("h1.rich_media_title") || text("#activity-name"),
+    account_name: text("#js_name"),
+    author: text(".rich_media_meta_text"),
+    publish_date: text("#publish_time"),
+    content_html: content ? content.innerHTML : "",
+    content_text: content ? content.innerText.trim() : "",
+    images: """ + _IMAGE_URLS_FN + """(content),
+  });
+})()"""
+
+# analyze_article() patterns, compiled once at import
+# (paragraphs are counted by opening tag; no need to match their bodies)
+_P_OPEN_RE = re.compile(r'<p\b')
+# <strong> bodies use the unrolled-loop form [^<]*(?:<(?!/strong>)[^<]*)*
+# rather than a lazy DOTALL .*?, so unclosed tags in malformed (or hostile)
+# article HTML can't trigger heavy backtracking (ReDoS)
+_STRONG_RE = re.compile(r'<strong\b[^>]*>([^<]*(?:<(?!/strong>)[^<]*)*)</strong>')
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+
+# Bytes read from the agent-browser stdout pipe per call
+_READ_CHUNK = 64 * 1024
+
+# Text shown on WeChat's "environment abnormal" verification page
+_ANTIBOT_RE = re.compile("环境异常|完成验证")
+
+
+def _read_result_line(stdout, deadline: float) -> Optional[bytes]:
+    """
+    Read a child's stdout to EOF, keeping only its result line.
+    
+    The result is the last line that looks like a JSON object or array
+    (agent-browser's --json output), or else the last non-empty line.
+    Returns None once the monotonic deadline passes, even if something
+    else (such as the browser daemon) still holds the pipe open.
+    """
+    fd = stdout.fileno()
+    result = fallback = b""
+    buf = bytearray()
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not selector.select(remaining):
+                return None
+            chunk = os.read(fd, _READ_CHUNK)
+            if chunk:
+                buf += chunk
+                newline = chunk.rfind(b"\n")
+                if newline < 0:
+                    continue
+                # Split off complete lines only; the rest waits for more
+                end = len(buf) - len(chunk) + newline
+                lines = buf[:end].split(b"\n")
+                del buf[:end + 1]
+            else:
+                lines = [buf]
+            for line in lines:
+                line = line.strip()
+                if line[:1] in (b"{", b"["):
+                    result = bytes(line)
+                elif line:
+                    fallback = bytes(line)
+            if not chunk:
+                return result or fallback
+
+
+def _browser_state_file() -> str:
+    """
+    Optional path to saved browser state (cookies, storage) to bypass anti-bot.
+    
+    Read from BROWSER_STATE_FILE at use time rather than import time, since
+    the MCP server's load_browser_cookies tool sets it while running.
+    """
+    return os.getenv("BROWSER_STATE_FILE", "")
+
+
+# ArticleContent fields in to_dict() order
+_ARTICLE_FIELDS = (
+    "url",
+    "title",
+    "author",
+    "account_name",
+    "publish_date",
+    "content_html",
+    "content_text",
+    "images",
+    "word_count",
+    "crawl_timestamp",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleContent:
     """Data class for article content."""
     url: str
@@ -53,19 +190,13 @@ class ArticleContent:
     crawl_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "url": self.url,
-            "title": self.title,
-            "author": self.author,
-            "account_name": self.account_name,
-            "publish_date": self.publish_date,
-            "content_html": self.content_html,
-            "content_text": self.content_text,
-            "images": self.images,
-            "word_count": self.word_count,
-            "crawl_timestamp": self.crawl_timestamp,
-        }
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The dict is shallow: values (including the images list) are the
+        instance's own objects, not copies.
+        """
+        return {name: getattr(self, name) for name in _ARTICLE_FIELDS}
 
 
 class WeixinSpiderAB:
@@ -78,81 +209,121 @@ class WeixinSpiderAB:
     Usage:
         spider = WeixinSpiderAB.get_instance()
         article = spider.crawl(url)
+        
+    Or with context manager (prepares the session once for many crawls):
+        with WeixinSpiderAB.get_instance() as spider:
+            article = spider.crawl(url)
     """
     
-    _instance: Optional['WeixinSpiderAB'] = None
-    _lock: threading.Lock = threading.Lock()
-    
     # Configuration constants
     PAGE_LOAD_TIMEOUT = 30000  # milliseconds for agent-browser
     MAX_KEY_PHRASE_LENGTH = 100
     READING_SPEED_CPM = 200
     
-    def __init__(self):
-        """Initialize instance."""
-        self._session_name = "weixin_spider"
+    def __init__(self, session_name: str = "weixin_spider"):
+        """
+        Initialize instance.
+        
+        Each session_name is a separate agent-browser session (its own
+        browser page), so distinct instances can crawl in parallel.
+        """
+        self._session_name = session_name
+        # Constant head of every agent-browser command line
+        self._cmd_prefix = (AGENT_BROWSER_BIN, "--session", session_name, "--json")
         self._initialized = False
         self._state_loaded = False
+        # Commands all target one browser session, so crawls take turns
+        self._crawl_lock = threading.Lock()
     
     @classmethod
     def get_instance(cls) -> 'WeixinSpiderAB':
-        """Get thread-safe singleton instance."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
-    
-    def _run_cmd(self, *args, timeout: int = 60) -> tuple[bool, str]:
+        """Get the shared instance (see _get_spider)."""
+        return _get_spider()
+    
+    def __enter__(self) -> 'WeixinSpiderAB':
+        """Context manager entry - load saved browser state once up front."""
+        with self._crawl_lock:
+            if _browser_state_file() and not self._state_loaded:
+                self._load_cookies_state()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Context manager exit - keep the session open for reuse."""
+        return False
+    
+    def _run_cmd(
+        self, *args, timeout: int = 60, quiet: bool = False
+    ) -> tuple[bool, Union[bytes, str]]:
         """
         Run agent-browser command.
         
-        Returns (success, output) tuple.
+        Returns (success, output) tuple. On success output is a single
+        stdout line as raw bytes, agent-browser's JSON result (see
+        _read_result_line()), handed to _parse_json() without a separate
+        decode pass; on failure it is the error message. With quiet=True,
+        failures and timeouts are logged at debug level (for best-effort
+        commands).
         """
-        cmd = [AGENT_BROWSER_BIN, "--session", self._session_name, "--json"] + list(args)
-        logger.debug(f"Running: {' '.join(cmd)}")
+        cmd = self._cmd_prefix + args
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Running: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
+            # stderr goes to a temp file so a chatty child can't fill the
+            # pipe and block while we're streaming stdout
+            with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            if result.returncode == 0:
-                return True, result.stdout.strip()
-            else:
-                logger.warning(f"Command failed: {result.stderr}")
-                return False, result.stderr.strip()
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            ) as proc:
+                # Stream stdout, keeping only the result line instead of
+                # buffering the whole output
+                deadline = time.monotonic() + timeout
+                output = _read_result_line(proc.stdout, deadline)
+                returncode = None
+                if output is not None:
+                    try:
+                        returncode = proc.wait(
+                            timeout=max(deadline - time.monotonic(), 0)
+                        )
+                    except subprocess.TimeoutExpired:
+                        pass
+                
+                if returncode is None:
+                    proc.kill()
+                    logger.log(
+                        logging.DEBUG if quiet else logging.ERROR,
+                        f"Command timed out: {cmd}",
+                    )
+                    return False, "Timeout"
+                
+                if returncode == 0:
+                    return True, output
+                else:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode("utf-8", errors="replace").strip()
+                    logger.log(
+                        logging.DEBUG if quiet else logging.WARNING,
+                        f"Command failed: {stderr}",
+                    )
+                    return False, stderr
                 
-        except subprocess.TimeoutExpired:
-            logger.error(f"Command timed out: {cmd}")
-            return False, "Timeout"
         except Exception as e:
             logger.error(f"Command error: {e}")
             return False, str(e)
     
-    def _parse_json(self, output: str) -> Any:
-        """Parse JSON output from agent-browser."""
+    def _parse_json(self, output: bytes) -> Any:
+        """Parse the JSON result line returned by _run_cmd()."""
         try:
-            parsed = json.loads(output)
+            parsed = orjson.loads(output)
             # agent-browser returns {success, data, error} wrapper
             if isinstance(parsed, dict) and "data" in parsed:
                 return parsed["data"]
             return parsed
-        except json.JSONDecodeError:
-            # Sometimes output includes non-JSON lines
-            for line in output.split('\n'):
-                if line.strip().startswith('{') or line.strip().startswith('['):
-                    try:
-                        parsed = json.loads(line)
-                        if isinstance(parsed, dict) and "data" in parsed:
-                            return parsed["data"]
-                        return parsed
-                    except:
-                        continue
-            return output
+        except orjson.JSONDecodeError:
+            # _run_cmd() already picked the JSON line out of any log
+            # lines, so this is plain-text output
+            return output.decode("utf-8", errors="replace")
     
     def crawl(
         self, 
@@ -176,68 +347,132 @@ class WeixinSpiderAB:
         if not self._is_valid_weixin_url(url):
             raise ValueError(f"Invalid WeChat article URL: {url}")
         
-        article = ArticleContent(url=url)
-        
-        try:
-            logger.info(f"Crawling with agent-browser: {url}")
-            
-            # Load saved browser state if available (helps bypass anti-bot)
-            if BROWSER_STATE_FILE and not self._state_loaded:
-                self._load_cookies_state()
-            
-            # Navigate to page
-            success, output = self._run_cmd("open", url)
-            if not success:
-                raise RuntimeError(f"Failed to open URL: {output}")
-            
-            # Wait for content to load
-            success, _ = self._run_cmd("wait", str(wait_time * 1000))
-            
-            # Wait for content element
-            success, _ = self._run_cmd("wait", "#js_content", timeout=wait_time + 10)
-            
-            # Check for anti-bot verification page
-            page_text = self._extract_text("body")
-            if "环境异常" in page_text or "完成验证" in page_text:
-                raise RuntimeError(
-                    "WeChat anti-bot verification detected. "
-                    "Try: 1) Use BROWSER_STATE_FILE with saved login state, "
-                    "2) Use residential proxy, "
-                    "3) Wait and retry later"
-                )
-            
-            # Extract title
-            article.title = self._extract_text("h1.rich_media_title")
-            if not article.title:
-                article.title = self._extract_text("#activity-name")
-            
-            # Extract author/account
-            article.account_name = self._extract_text("#js_name")
-            article.author = self._extract_text(".rich_media_meta_text")
-            
-            # Extract publish date
-            article.publish_date = self._extract_text("#publish_time")
-            
-            # Extract content
-            article.content_html = self._extract_html("#js_content")
-            article.content_text = self._extract_text("#js_content")
-            article.word_count = len(article.content_text)
-            
-            # Extract image URLs (no download in AB version)
-            article.images = self._extract_image_urls()
-            
-            logger.info(f"Successfully crawled: {article.title}")
-            return article
+        with self._crawl_lock:
+            article = ArticleContent(url=url)
             
-        except Exception as e:
-            logger.error(f"Error crawling {url}: {e}")
-            raise
+            try:
+                logger.info(f"Crawling with agent-browser: {url}")
+                
+                # Load saved browser state if available (helps bypass anti-bot)
+                if _browser_state_file() and not self._state_loaded:
+                    self._load_cookies_state()
+                
+                # Navigate to page
+                success, output = self._run_cmd("open", url)
+                if not success:
+                    raise RuntimeError(f"Failed to open URL: {output}")
+                
+                # Wait for content element; returns as soon as it exists
+                success, _ = self._run_cmd("wait", "#js_content", timeout=wait_time + 10)
+                
+                # Give late requests (lazy images) a short chance to settle;
+                # best effort, the content is already there, so hitting the
+                # timeout is expected and not worth more than a debug line
+                if success:
+                    self._run_cmd(
+                        "wait", "--load", "networkidle",
+                        "--timeout", str(NETWORK_IDLE_TIMEOUT * 1000),
+                        timeout=NETWORK_IDLE_TIMEOUT + NETWORK_IDLE_GRACE,
+                        quiet=True,
+                    )
+                
+                # Extract every field in one in-page evaluation, falling
+                # back to one CLI call per field if eval is unavailable
+                page = self._extract_page()
+                if page is None:
+                    page = self._extract_page_per_field()
+                
+                # Check for anti-bot verification page
+                page_text = page["body"]
+                if _ANTIBOT_RE.search(page_text):
+                    raise RuntimeError(
+                        "WeChat anti-bot verification detected. "
+                        "Try: 1) Use BROWSER_STATE_FILE with saved login state, "
+                        "2) Use residential proxy, "
+                        "3) Wait and retry later"
+                    )
+                
+                article.title = page["title"]
+                article.account_name = page["account_name"]
+                article.author = page["author"]
+                article.publish_date = page["publish_date"]
+                article.content_html = page["content_html"]
+                article.content_text = page["content_text"]
+                article.word_count = len(article.content_text)
+                
+                # Image URLs only (no download in AB version)
+                article.images = page["images"]
+                
+                logger.info(f"Successfully crawled: {article.title}")
+                return article
+                
+            except Exception as e:
+                logger.error(f"Error crawling {url}: {e}")
+                raise
+    
+    async def acrawl(
+        self,
+        url: str,
+        download_images: bool = False,
+        output_dir: Optional[str] = None,
+        wait_time: int = 10
+    ) -> ArticleContent:
+        """
+        Awaitable variant of crawl() for asyncio callers.
+        
+        Runs the blocking CLI calls in a worker thread.
+        """
+        return await asyncio.to_thread(
+            self.crawl, url, download_images, output_dir, wait_time
+        )
     
     def _is_valid_weixin_url(self, url: str) -> bool:
         """Check if URL is valid WeChat article URL."""
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.netloc in ['mp.weixin.qq.com', 'weixin.qq.com']
+        return url.startswith(_WEIXIN_PREFIXES)
+    
+    def _eval_js(self, script: str) -> Any:
+        """
+        Evaluate a JavaScript expression in the page.
+        
+        The expression should return a JSON string (JSON.stringify), which
+        is decoded here. Returns None if the command or decoding fails.
+        """
+        success, output = self._run_cmd("eval", script)
+        if not success:
+            return None
+        result = self._parse_json(output)
+        if isinstance(result, dict) and "result" in result:
+            result = result["result"]
+        if isinstance(result, str):
+            try:
+                return orjson.loads(result)
+            except orjson.JSONDecodeError:
+                return None
+        return result
+    
+    def _extract_page(self) -> Optional[Dict[str, Any]]:
+        """Extract all article fields with a single agent-browser call."""
+        page = self._eval_js(_EXTRACT_PAGE_JS)
+        if not isinstance(page, dict):
+            logger.debug("In-page extraction unavailable, using per-field calls")
+            return None
+        return page
+    
+    def _extract_page_per_field(self) -> Dict[str, Any]:
+        """Extract article fields with one agent-browser call per field."""
+        page = {
+            "body": self._extract_text("body"),
+            "title": self._extract_text("h1.rich_media_title"),
+            "account_name": self._extract_text("#js_name"),
+            "author": self._extract_text(".rich_media_meta_text"),
+            "publish_date": self._extract_text("#publish_time"),
+            "content_html": self._extract_html("#js_content"),
+            "content_text": self._extract_text("#js_content"),
+            "images": self._extract_image_urls(),
+        }
+        if not page["title"]:
+            page["title"] = self._extract_text("#activity-name")
+        return page
     
     def _extract_text(self, selector: str) -> str:
         """Extract text content using CSS selector."""
@@ -262,7 +497,16 @@ class WeixinSpiderAB:
         return ""
     
     def _extract_image_urls(self) -> List[Dict[str, str]]:
-        """Extract image URLs from page."""
+        """Extract image URLs from page with a single in-page query."""
+        images = self._eval_js(
+            f'JSON.stringify({_IMAGE_URLS_FN}(document.querySelector("#js_content")))'
+        )
+        if isinstance(images, list):
+            return images
+        return self._extract_image_urls_per_item()
+    
+    def _extract_image_urls_per_item(self) -> List[Dict[str, str]]:
+        """Extract image URLs with one agent-browser call per image."""
         images = []
         
         # Get count of images
@@ -277,67 +521,75 @@ class WeixinSpiderAB:
         elif isinstance(result, int):
             count = result
         
-        # Extract each image src
+        # Extract each image src, like _IMAGE_URLS_FN: data-src, then src
         for i in range(min(count, 20)):  # Limit to 20 images
             selector = f"#js_content img:nth-child({i+1})"
-            success, output = self._run_cmd("get", "attr", selector, "data-src")
-            if success:
-                result = self._parse_json(output)
-                src = ""
-                if isinstance(result, dict) and "value" in result:
-                    src = result["value"]
-                elif isinstance(result, str):
-                    src = result
-                
-                if src and not src.startswith("data:"):
-                    images.append({
-                        "index": i,
-                        "url": src,
-                        "alt": "",
-                    })
+            src = self._get_attr(selector, "data-src") or self._get_attr(selector, "src")
+            if src and not src.startswith("data:"):
+                images.append({
+                    "index": i,
+                    "url": src,
+                    "alt": self._get_attr(selector, "alt"),
+                })
         
         return images
     
+    def _get_attr(self, selector: str, name: str) -> str:
+        """Read one attribute of the first element matching selector."""
+        success, output = self._run_cmd("get", "attr", selector, name)
+        if not success:
+            return ""
+        result = self._parse_json(output)
+        if isinstance(result, dict) and "value" in result:
+            result = result["value"]
+        return result if isinstance(result, str) else ""
+    
     def analyze_article(self, article: ArticleContent) -> Dict[str, Any]:
         """Analyze article content for statistics."""
         analysis = {
             "word_count": article.word_count,
-            "char_count": len(article.content_text),
+            "char_count": article.word_count,
             "image_count": len(article.images),
             "paragraph_count": 0,
             "estimated_read_time_minutes": 0,
             "key_phrases": [],
         }
         
-        # Count paragraphs
-        if article.content_html:
-            analysis["paragraph_count"] = len(
-                re.findall(r'<p[^>]*>.*?</p>', article.content_html, re.DOTALL)
-            )
-        
         # Estimate read time
         analysis["estimated_read_time_minutes"] = round(
             article.word_count / self.READING_SPEED_CPM, 1
         )
         
-        # Extract key phrases (bold text)
-        if article.content_html:
-            strong_matches = re.findall(
-                r'<strong[^>]*>(.*?)</strong>', 
-                article.content_html, 
-                re.DOTALL
+        if not article.content_html:
+            return analysis
+        
+        if HTMLParser is not None:
+            tree = HTMLParser(article.content_html)
+            analysis["paragraph_count"] = len(tree.css("p"))
+            phrases = outer_strong_texts(tree)
+        else:
+            analysis["paragraph_count"] = sum(
+                1 for _ in _P_OPEN_RE.finditer(article.content_html)
             )
-            key_phrases = []
-            for match in strong_matches:
-                clean = re.sub(r'<[^>]+>', '', match).strip()
-                if clean and len(clean) < self.MAX_KEY_PHRASE_LENGTH:
-                    key_phrases.append(clean)
-            analysis["key_phrases"] = key_phrases[:10]
+            phrases = (
+                _TAG_STRIP_RE.sub('', match.group(1)).strip()
+                for match in _STRONG_RE.finditer(article.content_html)
+            )
+        
+        # Extract key phrases (bold text), stopping once 10 are found
+        key_phrases = []
+        for clean in phrases:
+            if clean and len(clean) < self.MAX_KEY_PHRASE_LENGTH:
+                key_phrases.append(clean)
+                if len(key_phrases) >= 10:
+                    break
+        analysis["key_phrases"] = key_phrases
         
         return analysis
     
     def summarize_article(self, article: ArticleContent) -> Dict[str, Any]:
         """Generate brief summary of article."""
+        text = article.content_text
         return {
             "title": article.title,
             "account_name": article.account_name,
@@ -345,18 +597,19 @@ class WeixinSpiderAB:
             "publish_date": article.publish_date,
             "word_count": article.word_count,
             "image_count": len(article.images),
-            "first_300_chars": article.content_text[:300] + "..." if len(article.content_text) > 300 else article.content_text,
+            "first_300_chars": text[:300] + ("..." if len(text) > 300 else ""),
             "url": article.url,
         }
     
     def _load_cookies_state(self):
         """Load saved browser state (cookies/storage) from file."""
-        if not BROWSER_STATE_FILE or not os.path.exists(BROWSER_STATE_FILE):
+        state_file = _browser_state_file()
+        if not state_file or not os.path.exists(state_file):
             return
             
         try:
-            with open(BROWSER_STATE_FILE, 'r') as f:
-                state = json.load(f)
+            with open(state_file, 'rb') as f:
+                state = orjson.loads(f.read())
             
             # Check if it's Playwright storageState format (from cursor-ide-browser)
             if isinstance(state, dict) and "cookies" in state:
@@ -394,23 +647,58 @@ class WeixinSpiderAB:
                 
             else:
                 # Legacy agent-browser state format
-                self._run_cmd("state", "load", BROWSER_STATE_FILE)
+                self._run_cmd("state", "load", state_file)
                 self._state_loaded = True
                 logger.info("Loaded agent-browser state file")
                 
         except Exception as e:
             logger.warning(f"Failed to load browser state: {e}")
     
+    def _close_at_exit(self):
+        """atexit hook: close the session unless close() already ran."""
+        if self._is_shared():
+            self.close()
+    
+    def _is_shared(self) -> bool:
+        """Whether this is the shared instance returned by _get_spider."""
+        return _spider is self
+    
     def close(self):
         """Close browser session."""
+        global _spider
         try:
             self._run_cmd("close", timeout=10)
             logger.info("Browser session closed")
         except Exception as e:
             logger.warning(f"Error closing browser: {e}")
         
-        with self._lock:
-            WeixinSpiderAB._instance = None
+        with _spider_lock:
+            if _spider is self:
+                _spider = None
+
+
+# Shared spider, created by the first _get_spider() call
+_spider: Optional[WeixinSpiderAB] = None
+_spider_lock = threading.Lock()
+
+
+def _get_spider() -> WeixinSpiderAB:
+    """
+    Get the shared spider instance, created on first use.
+    
+    Only creation takes the lock; once the instance exists it is read
+    without one. The browser session is closed at interpreter exit so
+    the agent-browser daemon doesn't keep an orphaned Chromium running.
+    """
+    global _spider
+    spider = _spider
+    if spider is None:
+        with _spider_lock:
+            if _spider is None:
+                _spider = WeixinSpiderAB()
+                atexit.register(_spider._close_at_exit)
+            spider = _spider
+    return spider
 
 
 # Convenience functions
@@ -420,14 +708,55 @@ def crawl_weixin_article_ab(
     output_dir: Optional[str] = None
 ) -> Dict[str, Any]:
     """Crawl WeChat article using agent-browser."""
-    spider = WeixinSpiderAB.get_instance()
+    spider = _get_spider()
     article = spider.crawl(url, download_images, output_dir)
     return article.to_dict()
 
 
+def crawl_many_ab(urls: List[str], concurrency: int = 4) -> List[Dict[str, Any]]:
+    """
+    Crawl several WeChat articles in parallel using agent-browser.
+    
+    Runs up to `concurrency` crawls at once, each worker on its own browser
+    session (the first reuses the singleton's). Results follow the input
+    order; failed URLs yield {"url": ..., "error": ...} entries.
+    """
+    if not urls:
+        return []
+    
+    workers = max(1, min(concurrency, len(urls)))
+    # Unique per call, so overlapping calls (or other processes) never
+    # share, or close, each other's sessions
+    prefix = f"weixin_spider_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+    extra = [
+        WeixinSpiderAB(session_name=f"{prefix}_{i}")
+        for i in range(1, workers)
+    ]
+    spiders: "queue.Queue[WeixinSpiderAB]" = queue.Queue()
+    for spider in [_get_spider()] + extra:
+        spiders.put(spider)
+    
+    def _crawl(url: str) -> Dict[str, Any]:
+        spider = spiders.get()
+        try:
+            return spider.crawl(url, download_images=False).to_dict()
+        except Exception as e:
+            logger.warning(f"Failed to crawl {url}: {e}")
+            return {"url": url, "error": str(e)}
+        finally:
+            spiders.put(spider)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_crawl, urls))
+    finally:
+        for spider in extra:
+            spider.close()
+
+
 def analyze_weixin_article_ab(url: str) -> Dict[str, Any]:
     """Crawl and analyze WeChat article."""
-    spider = WeixinSpiderAB.get_instance()
+    spider = _get_spider()
     article = spider.crawl(url, download_images=False)
     analysis = spider.analyze_article(article)
     return {
@@ -438,7 +767,7 @@ def analyze_weixin_article_ab(url: str) -> Dict[str, Any]:
 
 def summarize_weixin_article_ab(url: str) -> Dict[str, Any]:
     """Get brief summary of WeChat article."""
-    spider = WeixinSpiderAB.get_instance()
+    spider = _get_spider()
     article = spider.crawl(url, download_images=False)
     return spider.summarize_article(article)
 
@@ -12,31 +12,142 @@ Features:
 
 import os
 import re
-import time
+import shutil
+import queue
+import asyncio
 import hashlib
 import logging
+import functools
 import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Optional selectolax parser (None without it); analyze_article falls
+# back to regex
+from weixin_html import HTMLParser, outer_strong_texts
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Where the resolved ChromeDriver path is remembered between runs
+DRIVER_PATH_CACHE = Path.home() / ".cache" / "weixin_spider" / "driver_path"
+
+
+def _chromedriver_path(refresh: bool = False) -> str:
+    """
+    Path of the ChromeDriver binary.
+    
+    Reuses the path recorded by an earlier run while that file still
+    exists, skipping webdriver-manager's version check; otherwise (or with
+    refresh=True) installs through ChromeDriverManager and records it.
+    """
+    if not refresh:
+        try:
+            cached = DRIVER_PATH_CACHE.read_text(encoding="utf-8").strip()
+            if cached and os.path.exists(cached):
+                return cached
+        except OSError:
+            pass
+    
+    path = ChromeDriverManager().install()
+    try:
+        DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATH_CACHE.write_text(path, encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Could not cache ChromeDriver path: {e}")
+    return path
+
+
+# Hosts that serve WeChat articles
+_WEIXIN_HOSTS = frozenset({"mp.weixin.qq.com", "weixin.qq.com"})
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_host(url: str) -> str:
+    """Network location of a URL; cached since batches repeat URLs."""
+    return urlparse(url).netloc
+
+
+# analyze_article() patterns, compiled once at import
+# (paragraphs are counted by opening tag; no need to match their bodies)
+_P_OPEN_RE = re.compile(r'<p[\s>]')
+_STRONG_RE = re.compile(r'<strong[^>]*>(.*?)</strong>', re.DOTALL)
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+
+# Whitespace and (mostly CJK) punctuation, which aren't read as characters
+_PUNCT_TABLE = str.maketrans(
+    "", "", " \t\r\n\u3000。，！？、；：“”‘’（）《》【】…—·,.!?;:\"'()"
+)
+
+# True once the page has finished loading and #js_content has been filled
+# in (lazy images carry data-src, or there is a real amount of text)
+_CONTENT_READY_JS = """
+const content = document.getElementById("js_content");
+return document.readyState === "complete" && !!content && (
+  content.querySelector("img[data-src]") !== null ||
+  content.innerText.length > 100
+);
+"""
+
+# innerText of the first selector in arguments[0] with non-empty text,
+# or "" if none matches
+_FIRST_MATCH_JS = """
+for (const sel of arguments[0]) {
+  const el = document.querySelector(sel);
+  const text = el ? el.innerText.trim() : "";
+  if (text) return text;
+}
+return "";
+"""
+
+# Extracts every article field in one WebDriver round-trip. arguments[0]
+# maps field name -> selectors; each field takes the first non-empty match.
+_EXTRACT_ALL_JS = """
+const first = (selectors) => {
+  for (const sel of selectors) {
+    const el = document.querySelector(sel);
+    const text = el ? el.innerText.trim() : "";
+    if (text) return text;
+  }
+  return "";
+};
+const result = {};
+for (const [name, selectors] of Object.entries(arguments[0])) {
+  result[name] = first(selectors);
+}
+const content = document.getElementById("js_content");
+result.content_html = content ? content.innerHTML : "";
+result.content_text = content ? content.innerText.trim() : "";
+// WeChat uses data-src for lazy loading
+result.images = content ? Array.from(content.getElementsByTagName("img"))
+  .map((img, i) => ({
+    index: i,
+    url: img.getAttribute("data-src") || img.src || "",
+    alt: img.getAttribute("alt") || "",
+  }))
+  .filter((img) => img.url && !img.url.startsWith("data:")) : [];
+return result;
+"""
+
+
 @dataclass
 class ArticleContent:
     """Data class for article content."""
@@ -71,6 +182,10 @@ class WeixinSpider:
     """
     Thread-safe Singleton WeChat Article Spider using Chrome headless browser.
     
+    Crawls check out a browser from a small pool (up to DRIVER_POOL_SIZE
+    Chrome instances, started on demand), so concurrent callers crawl in
+    parallel instead of queueing on one tab.
+    
     Usage:
         spider = WeixinSpider.get_instance()
         article = spider.crawl(url)
@@ -85,8 +200,19 @@ class WeixinSpider:
     
     def __init__(self):
         """Initialize instance variables. Browser initialized lazily."""
-        self._driver: Optional[webdriver.Chrome] = None
         self._initialized: bool = False
+        self._http_session: Optional[requests.Session] = None
+        self._driver_path: Optional[str] = None
+        # Every driver started so far, and the ones not checked out
+        self._drivers: List[webdriver.Chrome] = []
+        self._idle_drivers: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        # Drivers started or being started, against DRIVER_POOL_SIZE
+        self._driver_slots: int = 0
+        self._pool_lock = threading.Lock()
+        # Driver checked out by the crawl running on this thread
+        self._local = threading.local()
+        # Drivers currently told to skip image requests
+        self._images_blocked: set = set()
     
     @classmethod
     def get_instance(cls) -> 'WeixinSpider':
@@ -115,15 +241,68 @@ class WeixinSpider:
     
     # Configuration constants
     PAGE_LOAD_TIMEOUT = 30
-    DYNAMIC_CONTENT_WAIT = 2
+    DYNAMIC_CONTENT_WAIT = 2  # Max seconds to wait for lazy content
     MAX_KEY_PHRASE_LENGTH = 100
     READING_SPEED_CPM = 200  # Characters per minute
+    IMAGE_DOWNLOAD_WORKERS = 8  # Concurrent image downloads per article
+    WEBDRIVER_POOL_MAXSIZE = 16  # Connections to chromedriver
+    DRIVER_POOL_SIZE = 4  # Max Chrome instances crawling at once
+    DRIVER_CHECKOUT_POLL = 1  # Seconds between closed checks while waiting
+    
+    # Image requests Chrome skips when images aren't downloaded (WeChat
+    # serves article images from mmbiz hosts, mostly without extensions)
+    BLOCKED_IMAGE_URLS = (
+        "*://mmbiz.qpic.cn/*",
+        "*://mmbiz.qlogo.cn/*",
+        "*.jpg",
+        "*.jpeg",
+        "*.png",
+        "*.gif",
+        "*.webp",
+    )
+    
+    # CSS selectors per metadata field, tried in order
+    TITLE_SELECTORS = ("h1.rich_media_title", "#activity-name", "h1")
+    AUTHOR_SELECTORS = (
+        "span.rich_media_meta.rich_media_meta_text",
+        "#js_name",
+        ".profile_nickname",
+    )
+    ACCOUNT_NAME_SELECTORS = ("#js_name", ".profile_nickname", "a.weui-wa-hotarea")
+    PUBLISH_DATE_SELECTORS = (
+        "#publish_time",
+        "em.rich_media_meta.rich_media_meta_text",
+        ".rich_media_meta_list em",
+    )
+    
+    @property
+    def _driver(self) -> Optional[webdriver.Chrome]:
+        """Driver checked out by the current thread's crawl."""
+        return getattr(self._local, "driver", None)
     
     def _init_browser(self):
-        """Initialize Chrome browser with headless options."""
+        """Start the first pooled Chrome browser; more start on demand."""
         if self._initialized:
             return
-            
+        
+        if self._http_session is None:
+            self._http_session = self._create_http_session()
+        
+        with self._pool_lock:
+            if self._initialized:
+                return
+            self._driver_slots += 1
+            try:
+                driver = self._start_driver()
+            except Exception:
+                self._driver_slots -= 1
+                raise
+            self._drivers.append(driver)
+            self._idle_drivers.put(driver)
+            self._initialized = True
+    
+    def _start_driver(self) -> webdriver.Chrome:
+        """Launch one Chrome browser with headless options."""
         options = Options()
         options.add_argument("--headless=new")
         options.add_argument("--no-sandbox")
@@ -132,19 +311,141 @@ class WeixinSpider:
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
-        # Disable images for faster loading (optional)
-        # options.add_argument("--blink-settings=imagesEnabled=false")
-        
         try:
-            service = Service(ChromeDriverManager().install())
-            self._driver = webdriver.Chrome(service=service, options=options)
-            self._driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
-            self._initialized = True
-            logger.info("Chrome browser initialized successfully")
+            if self._driver_path is None:
+                self._driver_path = _chromedriver_path()
+            try:
+                driver = webdriver.Chrome(
+                    service=Service(self._driver_path), options=options
+                )
+            except WebDriverException:
+                # A cached driver may no longer match the installed Chrome
+                fresh_path = _chromedriver_path(refresh=True)
+                if fresh_path == self._driver_path:
+                    raise
+                self._driver_path = fresh_path
+                driver = webdriver.Chrome(
+                    service=Service(self._driver_path), options=options
+                )
+            driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+            self._widen_webdriver_pool(driver)
+            logger.info(
+                f"Chrome browser initialized successfully "
+                f"({self._driver_slots}/{self.DRIVER_POOL_SIZE})"
+            )
+            return driver
         except Exception as e:
             logger.error(f"Failed to initialize Chrome browser: {e}")
             raise
     
+    def _checkout_driver(self) -> webdriver.Chrome:
+        """
+        Take an idle driver from the pool, starting a new one while the
+        pool is below DRIVER_POOL_SIZE, or else wait for one to be freed.
+        
+        Raises RuntimeError if the spider is closed while waiting.
+        """
+        while True:
+            if not self._initialized:
+                raise RuntimeError("Spider was closed while waiting for a browser")
+            try:
+                return self._idle_drivers.get_nowait()
+            except queue.Empty:
+                pass
+            # Reserve a slot under the lock; Chrome starts outside it so
+            # returning and checking out drivers don't wait on the launch
+            with self._pool_lock:
+                reserved = self._driver_slots < self.DRIVER_POOL_SIZE
+                if reserved:
+                    self._driver_slots += 1
+            if reserved:
+                return self._start_reserved_driver()
+            try:
+                return self._idle_drivers.get(timeout=self.DRIVER_CHECKOUT_POLL)
+            except queue.Empty:
+                continue
+    
+    def _start_reserved_driver(self) -> webdriver.Chrome:
+        """Start a driver for a slot reserved by _checkout_driver()."""
+        try:
+            driver = self._start_driver()
+        except Exception:
+            with self._pool_lock:
+                self._driver_slots -= 1
+            raise
+        with self._pool_lock:
+            if self._initialized:
+                self._drivers.append(driver)
+                return driver
+            self._driver_slots -= 1
+        # close() ran while Chrome was starting
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+        raise RuntimeError("Spider was closed while starting a browser")
+    
+    def _set_images_blocked(self, blocked: bool):
+        """
+        Block or unblock image requests in the running browser.
+        
+        Uses the DevTools Network domain, so it applies from the next
+        navigation without restarting Chrome. Failures are logged and
+        leave images enabled.
+        """
+        driver = self._driver
+        if blocked == (driver in self._images_blocked):
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": list(self.BLOCKED_IMAGE_URLS) if blocked else []},
+            )
+            if blocked:
+                self._images_blocked.add(driver)
+            else:
+                self._images_blocked.discard(driver)
+        except Exception as e:
+            logger.warning(f"Failed to toggle image loading: {e}")
+    
+    def _widen_webdriver_pool(self, driver: webdriver.Chrome):
+        """
+        Raise the connection pool size of the WebDriver HTTP client.
+        
+        Selenium talks to chromedriver through a urllib3 PoolManager with
+        a single connection per host, so commands from several threads
+        queue up or log "connection pool is full". The pool is an internal
+        of RemoteConnection, so this is skipped if it isn't found.
+        """
+        conn = getattr(driver.command_executor, "_conn", None)
+        pool_kw = getattr(conn, "connection_pool_kw", None)
+        if pool_kw is None:
+            return
+        pool_kw["maxsize"] = self.WEBDRIVER_POOL_MAXSIZE
+        # Drop pools created with the old size
+        conn.clear()
+    
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        Create the HTTP session used for image downloads.
+        
+        Images of an article mostly come from the same CDN hosts, so a
+        shared keep-alive pool saves a TCP/TLS handshake per image. The
+        pool is sized above IMAGE_DOWNLOAD_WORKERS so parallel downloads
+        don't wait for a free connection.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def crawl(
         self, 
         url: str, 
@@ -167,10 +468,18 @@ class WeixinSpider:
         if not self._is_valid_weixin_url(url):
             raise ValueError(f"Invalid WeChat article URL: {url}")
         
+        if not self._initialized:
+            self._init_browser()
+        
         article = ArticleContent(url=url)
+        driver = self._checkout_driver()
+        self._local.driver = driver
         
         try:
             logger.info(f"Crawling: {url}")
+            # Image URLs come from the DOM either way; Chrome only needs
+            # to fetch the images themselves when they'll be downloaded
+            self._set_images_blocked(not download_images)
             self._driver.get(url)
             
             # Wait for content to load
@@ -178,27 +487,36 @@ class WeixinSpider:
                 EC.presence_of_element_located((By.ID, "js_content"))
             )
             
-            # Additional wait for dynamic content
-            time.sleep(self.DYNAMIC_CONTENT_WAIT)
+            # Additional wait for dynamic content, at most
+            # DYNAMIC_CONTENT_WAIT seconds and only until it looks ready
+            try:
+                WebDriverWait(self._driver, self.DYNAMIC_CONTENT_WAIT).until(
+                    lambda driver: driver.execute_script(_CONTENT_READY_JS)
+                )
+            except TimeoutException:
+                logger.debug("Dynamic content wait timed out, extracting anyway")
             
-            # Extract article metadata
-            article.title = self._extract_title()
-            article.author = self._extract_author()
-            article.account_name = self._extract_account_name()
-            article.publish_date = self._extract_publish_date()
+            # Extract every field in one script call, falling back to
+            # one WebDriver lookup per field if the script fails
+            page = self._extract_all_js()
+            if page is None:
+                page = self._extract_all_per_field()
             
-            # Extract content
-            article.content_html = self._extract_content_html()
-            article.content_text = self._extract_content_text()
+            article.title = page["title"]
+            article.author = page["author"]
+            article.account_name = page["account_name"]
+            article.publish_date = page["publish_date"]
+            article.content_html = page["content_html"]
+            article.content_text = page["content_text"]
             article.word_count = len(article.content_text)
             
             # Download images if requested
             if download_images:
                 article.images = self._extract_and_download_images(
-                    url, output_dir
+                    url, output_dir, images=page["images"]
                 )
             else:
-                article.images = self._extract_image_urls()
+                article.images = page["images"]
             
             logger.info(f"Successfully crawled: {article.title}")
             return article
@@ -209,30 +527,74 @@ class WeixinSpider:
         except Exception as e:
             logger.error(f"Error crawling {url}: {e}")
             raise
+        finally:
+            self._local.driver = None
+            # Drivers quit by close() mid-crawl are not returned
+            with self._pool_lock:
+                if driver in self._drivers:
+                    self._idle_drivers.put(driver)
+    
+    async def acrawl(
+        self,
+        url: str,
+        download_images: bool = True,
+        output_dir: Optional[str] = None,
+        wait_time: int = 10
+    ) -> ArticleContent:
+        """
+        Awaitable variant of crawl() for asyncio callers.
+        
+        Selenium is synchronous, so the crawl runs in a worker thread and
+        the event loop stays free while the page loads.
+        """
+        return await asyncio.to_thread(
+            self.crawl, url, download_images, output_dir, wait_time
+        )
     
     def _is_valid_weixin_url(self, url: str) -> bool:
         """Check if URL is a valid WeChat article URL."""
-        parsed = urlparse(url)
-        return parsed.netloc in ['mp.weixin.qq.com', 'weixin.qq.com']
+        return _parse_host(url) in _WEIXIN_HOSTS
+    
+    def _extract_all_js(self) -> Optional[Dict[str, Any]]:
+        """
+        Extract all article fields with a single execute_script call.
+        
+        Returns None if the script fails, so the caller can fall back to
+        _extract_all_per_field().
+        """
+        try:
+            return self._driver.execute_script(_EXTRACT_ALL_JS, {
+                "title": self.TITLE_SELECTORS,
+                "author": self.AUTHOR_SELECTORS,
+                "account_name": self.ACCOUNT_NAME_SELECTORS,
+                "publish_date": self.PUBLISH_DATE_SELECTORS,
+            })
+        except Exception as e:
+            logger.warning(f"Batched extraction failed, using per-field lookups: {e}")
+            return None
+    
+    def _extract_all_per_field(self) -> Dict[str, Any]:
+        """Extract article fields with separate WebDriver lookups."""
+        return {
+            "title": self._extract_title(),
+            "author": self._extract_author(),
+            "account_name": self._extract_account_name(),
+            "publish_date": self._extract_publish_date(),
+            "content_html": self._extract_content_html(),
+            "content_text": self._extract_content_text(),
+            "images": self._extract_image_urls(),
+        }
+    
+    def _first_text(self, selectors: tuple) -> str:
+        """Return the text of the first selector that matches non-empty text."""
+        # All selectors are probed in the page, in order, in one round-trip
+        return self._driver.execute_script(_FIRST_MATCH_JS, list(selectors)) or ""
     
     def _extract_title(self) -> str:
         """Extract article title."""
         try:
             # Try multiple selectors
-            selectors = [
-                "h1.rich_media_title",
-                "#activity-name",
-                "h1",
-            ]
-            for selector in selectors:
-                try:
-                    elem = self._driver.find_element(By.CSS_SELECTOR, selector)
-                    title = elem.text.strip()
-                    if title:
-                        return title
-                except NoSuchElementException:
-                    continue
-            return ""
+            return self._first_text(self.TITLE_SELECTORS)
         except Exception as e:
             logger.warning(f"Failed to extract title: {e}")
             return ""
@@ -240,20 +602,7 @@ class WeixinSpider:
     def _extract_author(self) -> str:
         """Extract article author."""
         try:
-            selectors = [
-                "span.rich_media_meta.rich_media_meta_text",
-                "#js_name",
-                ".profile_nickname",
-            ]
-            for selector in selectors:
-                try:
-                    elem = self._driver.find_element(By.CSS_SELECTOR, selector)
-                    author = elem.text.strip()
-                    if author:
-                        return author
-                except NoSuchElementException:
-                    continue
-            return ""
+            return self._first_text(self.AUTHOR_SELECTORS)
         except Exception as e:
             logger.warning(f"Failed to extract author: {e}")
             return ""
@@ -261,20 +610,7 @@ class WeixinSpider:
     def _extract_account_name(self) -> str:
         """Extract public account name."""
         try:
-            selectors = [
-                "#js_name",
-                ".profile_nickname",
-                "a.weui-wa-hotarea",
-            ]
-            for selector in selectors:
-                try:
-                    elem = self._driver.find_element(By.CSS_SELECTOR, selector)
-                    name = elem.text.strip()
-                    if name:
-                        return name
-                except NoSuchElementException:
-                    continue
-            return ""
+            return self._first_text(self.ACCOUNT_NAME_SELECTORS)
         except Exception as e:
             logger.warning(f"Failed to extract account name: {e}")
             return ""
@@ -282,20 +618,7 @@ class WeixinSpider:
     def _extract_publish_date(self) -> str:
         """Extract publish date."""
         try:
-            selectors = [
-                "#publish_time",
-                "em.rich_media_meta.rich_media_meta_text",
-                ".rich_media_meta_list em",
-            ]
-            for selector in selectors:
-                try:
-                    elem = self._driver.find_element(By.CSS_SELECTOR, selector)
-                    date = elem.text.strip()
-                    if date:
-                        return date
-                except NoSuchElementException:
-                    continue
-            return ""
+            return self._first_text(self.PUBLISH_DATE_SELECTORS)
         except Exception as e:
             logger.warning(f"Failed to extract publish date: {e}")
             return ""
@@ -312,8 +635,12 @@ class WeixinSpider:
     def _extract_content_text(self) -> str:
         """Extract article content as plain text."""
         try:
-            content_elem = self._driver.find_element(By.ID, "js_content")
-            return content_elem.text.strip()
+            # innerText in the page is much cheaper than WebElement.text,
+            # which chromedriver computes node by node
+            return self._driver.execute_script(
+                'const e = document.getElementById("js_content");'
+                ' return e ? e.innerText.trim() : "";'
+            )
         except Exception as e:
             logger.warning(f"Failed to extract text content: {e}")
             return ""
@@ -343,51 +670,72 @@ class WeixinSpider:
     def _extract_and_download_images(
         self, 
         article_url: str,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        images: Optional[List[Dict[str, str]]] = None
     ) -> List[Dict[str, str]]:
-        """Extract and download images."""
-        images = self._extract_image_urls()
+        """Extract (unless already given) and download images."""
+        if images is None:
+            images = self._extract_image_urls()
         if not images:
             return images
         
         # Create output directory
         if output_dir is None:
-            url_hash = hashlib.md5(article_url.encode()).hexdigest()[:8]
+            url_hash = hashlib.md5(
+                article_url.encode(), usedforsecurity=False
+            ).hexdigest()[:8]
             output_dir = f"./downloads/{url_hash}"
         
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        for img in images:
-            try:
-                response = requests.get(img["url"], timeout=30)
-                if response.status_code == 200:
-                    # Determine file extension
-                    content_type = response.headers.get("content-type", "")
-                    if "jpeg" in content_type or "jpg" in content_type:
-                        ext = ".jpg"
-                    elif "png" in content_type:
-                        ext = ".png"
-                    elif "gif" in content_type:
-                        ext = ".gif"
-                    elif "webp" in content_type:
-                        ext = ".webp"
-                    else:
-                        ext = ".jpg"  # default
-                    
-                    filename = f"image_{img['index']:03d}{ext}"
-                    filepath = os.path.join(output_dir, filename)
-                    
-                    with open(filepath, "wb") as f:
-                        f.write(response.content)
-                    
-                    img["local_path"] = filepath
-                    logger.debug(f"Downloaded: {filename}")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to download image {img['index']}: {e}")
+        # Downloads are network-bound, so fetch them in parallel threads
+        workers = min(self.IMAGE_DOWNLOAD_WORKERS, len(images))
+        # A failed image is logged and skipped without holding up the rest
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._download_one, img, output_dir): img
+                for img in images
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    img = futures[future]
+                    logger.warning(f"Failed to download image {img['index']}: {e}")
         
         return images
     
+    def _download_one(self, img: Dict[str, str], output_dir: str) -> Dict[str, str]:
+        """Download one image, recording its local_path on success."""
+        # Stream the body to disk instead of buffering the whole image
+        with self._http_session.get(img["url"], timeout=30, stream=True) as response:
+            if response.status_code == 200:
+                # Determine file extension
+                content_type = response.headers.get("content-type", "")
+                if "jpeg" in content_type or "jpg" in content_type:
+                    ext = ".jpg"
+                elif "png" in content_type:
+                    ext = ".png"
+                elif "gif" in content_type:
+                    ext = ".gif"
+                elif "webp" in content_type:
+                    ext = ".webp"
+                else:
+                    ext = ".jpg"  # default
+                
+                filename = f"image_{img['index']:03d}{ext}"
+                filepath = os.path.join(output_dir, filename)
+                
+                # Let urllib3 undo any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                with open(filepath, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, 65536)
+                
+                img["local_path"] = filepath
+                logger.debug(f"Downloaded: {filename}")
+        
+        return img
+    
     def analyze_article(self, article: ArticleContent) -> Dict[str, Any]:
         """
         Analyze article content for basic statistics.
@@ -407,31 +755,38 @@ class WeixinSpider:
             "key_phrases": [],
         }
         
-        # Count paragraphs
-        if article.content_html:
-            analysis["paragraph_count"] = len(
-                re.findall(r'<p[^>]*>.*?</p>', article.content_html, re.DOTALL)
-            )
-        
-        # Estimate read time (average Chinese characters per minute)
+        # Estimate read time (average Chinese characters per minute),
+        # counting only characters that are actually read
+        readable_chars = len(article.content_text.translate(_PUNCT_TABLE))
         analysis["estimated_read_time_minutes"] = round(
-            article.word_count / self.READING_SPEED_CPM, 1
+            readable_chars / self.READING_SPEED_CPM, 1
         )
         
-        # Extract key phrases (bold/strong text)
-        if article.content_html:
-            strong_matches = re.findall(
-                r'<strong[^>]*>(.*?)</strong>', 
-                article.content_html, 
-                re.DOTALL
+        if not article.content_html:
+            return analysis
+        
+        # Count paragraphs and collect bold/strong text, parsing the HTML
+        # once when selectolax is installed
+        if HTMLParser is not None:
+            tree = HTMLParser(article.content_html)
+            analysis["paragraph_count"] = len(tree.css("p"))
+            phrases = list(outer_strong_texts(tree))
+        else:
+            analysis["paragraph_count"] = sum(
+                1 for _ in _P_OPEN_RE.finditer(article.content_html)
             )
             # Clean HTML tags from matches
-            key_phrases = []
-            for match in strong_matches:
-                clean = re.sub(r'<[^>]+>', '', match).strip()
-                if clean and len(clean) < self.MAX_KEY_PHRASE_LENGTH:
-                    key_phrases.append(clean)
-            analysis["key_phrases"] = key_phrases[:10]  # Top 10
+            phrases = [
+                _TAG_STRIP_RE.sub('', match).strip()
+                for match in _STRONG_RE.findall(article.content_html)
+            ]
+        
+        # Extract key phrases (bold/strong text)
+        key_phrases = [
+            clean for clean in phrases
+            if clean and len(clean) < self.MAX_KEY_PHRASE_LENGTH
+        ]
+        analysis["key_phrases"] = key_phrases[:10]  # Top 10
         
         return analysis
     
@@ -460,25 +815,38 @@ class WeixinSpider:
         return summary
     
     def close(self):
-        """Close the browser and reset singleton."""
-        with self._lock:
-            if self._driver:
+        """Close all pooled browsers and reset singleton."""
+        with self._lock, self._pool_lock:
+            for driver in self._drivers:
                 try:
-                    self._driver.quit()
+                    driver.quit()
                 except Exception as e:
                     logger.warning(f"Error closing browser: {e}")
-                self._driver = None
-                self._initialized = False
+            # Browsers still starting release their own slots
+            self._driver_slots -= len(self._drivers)
+            self._drivers = []
+            # Drain rather than replace the queue, so waiting checkouts
+            # see the close instead of holding on to a dead queue
+            while True:
+                try:
+                    self._idle_drivers.get_nowait()
+                except queue.Empty:
+                    break
+            self._images_blocked.clear()
+            self._initialized = False
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
             WeixinSpider._instance = None
             logger.info("Browser closed")
     
     def __del__(self):
         """Cleanup on deletion - best effort, not guaranteed."""
-        try:
-            if self._driver:
-                self._driver.quit()
-        except Exception:
-            pass  # Ignore errors during cleanup
+        for driver in getattr(self, "_drivers", []):
+            try:
+                driver.quit()
+            except Exception:
+                pass  # Ignore errors during cleanup
 
 
 # Convenience functions for direct usage